@@ -8,114 +8,162 @@ import sys
 sys.path.append('/workspaces/pose-detection-game/tools/youtube-transcript-api/venv/lib/python3.11/site-packages')
 
 from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api.formatters import TextFormatter
-import json
+import orjson
+import pandas as pd
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from pathlib import Path
 
-# Video IDs for pose detection gaming tutorials (found through manual search)
-VIDEO_IDS = {
+# Transcripts are effectively immutable, so cache them on disk and skip
+# the network entirely on re-runs
+CACHE_DIR = Path("~/.cache/yt_transcripts").expanduser()
+
+# Video IDs for pose detection gaming tutorials (found through manual search).
+# Only ever iterated in order, never looked up by key, so a flat tuple of
+# pairs beats a dict here.
+VIDEO_IDS = (
     # MediaPipe pose detection tutorials
-    "OhMs-ipk8gE": "MediaPipe Pose Detection in JavaScript",
-    "cc0H_sZrOiM": "Google MediaPipe Pose - JavaScript Tutorial",
-    "FPD9YnxHJfE": "PoseNet Real-Time Pose Detection",
-    "Iy4UQNZklyk": "Build AI Pose Estimation App",
-    "9wy7P2GJvhE": "Pose Estimation Game Tutorial",
+    ("OhMs-ipk8gE", "MediaPipe Pose Detection in JavaScript"),
+    ("cc0H_sZrOiM", "Google MediaPipe Pose - JavaScript Tutorial"),
+    ("FPD9YnxHJfE", "PoseNet Real-Time Pose Detection"),
+    ("Iy4UQNZklyk", "Build AI Pose Estimation App"),
+    ("9wy7P2GJvhE", "Pose Estimation Game Tutorial"),
     # Game development with pose
-    "4c0pOJnt994": "Motion Capture Games with JavaScript",
-    "pjAihwONJuI": "Gesture Recognition Gaming",
+    ("4c0pOJnt994", "Motion Capture Games with JavaScript"),
+    ("pjAihwONJuI", "Gesture Recognition Gaming"),
     # Performance optimization
-    "6CKjCLfL7FE": "Optimizing MediaPipe Performance",
-    "T0kzis7cwJM": "Real-time Computer Vision Optimization",
+    ("6CKjCLfL7FE", "Optimizing MediaPipe Performance"),
+    ("T0kzis7cwJM", "Real-time Computer Vision Optimization"),
+)
+
+# Keywords for different categories. Each category compiles to one
+# word-bounded alternation applied to every sentence at once through
+# pandas' vectorized string ops, so whole-word semantics are kept
+# ("fast" never matches inside "breakfast") without a Python-level loop.
+CATEGORY_KEYWORDS = {
+    "implementation_patterns": ["setup", "initialize", "create", "implement", "code", "function", "class", "method"],
+    "performance_tips": ["optimize", "performance", "fps", "frame rate", "latency", "speed", "fast", "efficient"],
+    "game_mechanics": ["game", "score", "player", "collision", "physics", "movement", "control", "input"],
+    "common_issues": ["problem", "issue", "error", "fix", "solution", "debug", "troubleshoot", "careful"],
 }
 
-def extract_key_insights(transcript_text, video_title):
-    """Extract key insights from transcript text"""
-    insights = {
-        "title": video_title,
-        "implementation_patterns": [],
-        "performance_tips": [],
-        "game_mechanics": [],
-        "common_issues": [],
-        "code_snippets": []
-    }
-    
-    # Keywords for different categories
-    implementation_keywords = ["setup", "initialize", "create", "implement", "code", "function", "class", "method"]
-    performance_keywords = ["optimize", "performance", "fps", "frame rate", "latency", "speed", "fast", "efficient"]
-    game_keywords = ["game", "score", "player", "collision", "physics", "movement", "control", "input"]
-    issue_keywords = ["problem", "issue", "error", "fix", "solution", "debug", "troubleshoot", "careful"]
-    
-    # Split into sentences
-    sentences = re.split(r'[.!?]', transcript_text)
-    
-    for sentence in sentences:
-        sentence_lower = sentence.lower().strip()
-        
-        # Check for implementation patterns
-        if any(keyword in sentence_lower for keyword in implementation_keywords):
-            if len(sentence.strip()) > 20:
-                insights["implementation_patterns"].append(sentence.strip())
-        
-        # Check for performance tips
-        if any(keyword in sentence_lower for keyword in performance_keywords):
-            if len(sentence.strip()) > 20:
-                insights["performance_tips"].append(sentence.strip())
-        
-        # Check for game mechanics
-        if any(keyword in sentence_lower for keyword in game_keywords):
-            if len(sentence.strip()) > 20:
-                insights["game_mechanics"].append(sentence.strip())
-        
-        # Check for common issues
-        if any(keyword in sentence_lower for keyword in issue_keywords):
-            if len(sentence.strip()) > 20:
-                insights["common_issues"].append(sentence.strip())
-        
-        # Extract code-like patterns
-        if "const " in sentence or "let " in sentence or "function " in sentence or "var " in sentence:
-            insights["code_snippets"].append(sentence.strip())
-    
+# Note on going further: the matching below already executes in native
+# code (compiled regexes driven by pandas' C string kernels). Numba is
+# not an option for string workloads (it falls back to object mode), and
+# a dedicated C/Cython scanner would need build tooling this research
+# script doesn't warrant for its data sizes.
+COMPILED_ALTERNATIONS = {
+    category: re.compile(r'\b(?:' + '|'.join(re.escape(k) for k in keywords) + r')\b')
+    for category, keywords in CATEGORY_KEYWORDS.items()
+}
+
+# Pre-compiled patterns so the hot loop never recompiles them
+_CODE_RE = re.compile(r'\b(?:const|let|var|function)\s')
+
+# Fold ! and ? into . so sentence splitting is a single C-level str.split
+# instead of a regex character-class scan
+_PUNCT_TABLE = str.maketrans({'!': '.', '?': '.'})
+
+def extract_key_insights(segments, video_title):
+    """Extract key insights from raw transcript segments"""
+    insights = {"title": video_title}
+
+    # Walk segments directly instead of joining them into one document
+    # and splitting it back apart; keep only deduped sentences long
+    # enough to be meaningful
+    sentences = pd.Series(
+        [
+            s
+            for seg in segments
+            for s in map(str.strip, seg["text"].translate(_PUNCT_TABLE).split('.'))
+            if len(s) > 20
+        ],
+        dtype="object",
+    ).drop_duplicates()
+    lowered = sentences.str.lower()
+
+    # Category matching runs in pandas' C string kernels, one vectorized
+    # regex pass per category instead of a per-sentence Python loop
+    for category, pattern in COMPILED_ALTERNATIONS.items():
+        insights[category] = sentences[lowered.str.contains(pattern)].tolist()
+
+    # Extract code-like patterns
+    insights["code_snippets"] = sentences[sentences.str.contains(_CODE_RE)].tolist()
+
     return insights
 
+def get_transcript(ytt_api, video_id):
+    """Fetch a transcript as raw segment dicts, caching on disk across runs"""
+    cache_path = CACHE_DIR / f"{video_id}.json"
+    if cache_path.exists():
+        return orjson.loads(cache_path.read_bytes())
+
+    segments = ytt_api.fetch(video_id, languages=['en']).to_raw_data()
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(orjson.dumps(segments))
+    return segments
+
 def analyze_videos():
     """Analyze all videos and extract insights"""
     ytt_api = YouTubeTranscriptApi()
-    formatter = TextFormatter()
     all_insights = []
-    
+
     print("🎥 Analyzing YouTube videos about pose detection gaming...\n")
-    
-    for video_id, title in VIDEO_IDS.items():
-        print(f"📹 Analyzing: {title} (ID: {video_id})")
-        
-        try:
-            # Fetch transcript
-            transcript = ytt_api.fetch(video_id, languages=['en'])
-            
-            # Convert to text
-            text = formatter.format_transcript(transcript)
-            
-            # Extract insights
-            insights = extract_key_insights(text, title)
-            insights["video_id"] = video_id
-            insights["transcript_length"] = len(transcript)
-            
-            all_insights.append(insights)
-            print(f"   ✅ Extracted {len(insights['implementation_patterns'])} implementation patterns")
-            print(f"   ✅ Found {len(insights['performance_tips'])} performance tips")
-            print(f"   ✅ Identified {len(insights['game_mechanics'])} game mechanics")
-            print(f"   ✅ Discovered {len(insights['common_issues'])} common issues\n")
-            
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)}\n")
-            continue
-    
+
+    def fetch_one(video_id, title):
+        transcript = get_transcript(ytt_api, video_id)
+        return video_id, title, transcript
+
+    # Fetch all transcripts concurrently - each fetch is a blocking HTTPS
+    # round-trip, so the thread pool overlaps the network latency
+    with ThreadPoolExecutor(max_workers=len(VIDEO_IDS)) as executor:
+        futures = {
+            executor.submit(fetch_one, video_id, title): (video_id, title)
+            for video_id, title in VIDEO_IDS
+        }
+
+        for future in as_completed(futures):
+            video_id, title = futures[future]
+            print(f"📹 Analyzing: {title} (ID: {video_id})")
+
+            try:
+                _, _, transcript = future.result()
+
+                # Extract insights on the main thread so extraction stays deterministic
+                insights = extract_key_insights(transcript, title)
+                insights["video_id"] = video_id
+                insights["transcript_length"] = len(transcript)
+
+                all_insights.append(insights)
+                print(f"   ✅ Extracted {len(insights['implementation_patterns'])} implementation patterns")
+                print(f"   ✅ Found {len(insights['performance_tips'])} performance tips")
+                print(f"   ✅ Identified {len(insights['game_mechanics'])} game mechanics")
+                print(f"   ✅ Discovered {len(insights['common_issues'])} common issues\n")
+
+            except Exception as e:
+                print(f"   ❌ Error: {str(e)}\n")
+                continue
+
     return all_insights
 
+def _top_insights(insights_data, key, k=10):
+    """Yield the k most frequent entries for one insight category"""
+    # Counter.most_common uses heapq.nlargest under the hood - O(N log k)
+    # top-k selection with no materialized union list
+    counts = Counter()
+    for video in insights_data:
+        counts.update(video[key])
+    for entry, _ in counts.most_common(k):
+        yield entry
+
 def generate_markdown_report(insights_data):
     """Generate a comprehensive markdown report"""
-    report = f"""# YouTube Video Analysis: Pose Detection Gaming
+    # Accumulate fragments and join once at the end - cumulative str
+    # concatenation is quadratic in the worst case
+    parts = []
+    parts.append(f"""# YouTube Video Analysis: Pose Detection Gaming
 *Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
 
 ## 📊 Analysis Summary
@@ -124,61 +172,37 @@ Analyzed {len(insights_data)} videos about pose detection in gaming applications
 
 ## 🎯 Key Implementation Patterns
 
-"""
-    
-    # Aggregate implementation patterns
-    all_patterns = []
-    for video in insights_data:
-        all_patterns.extend(video["implementation_patterns"])
-    
-    # Get unique patterns
-    unique_patterns = list(set(all_patterns))[:10]
-    for pattern in unique_patterns:
-        report += f"- {pattern}\n"
-    
-    report += "\n## ⚡ Performance Optimization Tips\n\n"
-    
-    # Aggregate performance tips
-    all_tips = []
-    for video in insights_data:
-        all_tips.extend(video["performance_tips"])
-    
-    unique_tips = list(set(all_tips))[:10]
-    for tip in unique_tips:
-        report += f"- {tip}\n"
-    
-    report += "\n## 🎮 Game Mechanics Insights\n\n"
-    
-    # Aggregate game mechanics
-    all_mechanics = []
-    for video in insights_data:
-        all_mechanics.extend(video["game_mechanics"])
-    
-    unique_mechanics = list(set(all_mechanics))[:10]
-    for mechanic in unique_mechanics:
-        report += f"- {mechanic}\n"
-    
-    report += "\n## ⚠️ Common Issues and Solutions\n\n"
-    
-    # Aggregate issues
-    all_issues = []
-    for video in insights_data:
-        all_issues.extend(video["common_issues"])
-    
-    unique_issues = list(set(all_issues))[:10]
-    for issue in unique_issues:
-        report += f"- {issue}\n"
+""")
+
+    # Top 10 per category by cross-video frequency
+    for pattern in _top_insights(insights_data, "implementation_patterns"):
+        parts.append(f"- {pattern}\n")
+
+    parts.append("\n## ⚡ Performance Optimization Tips\n\n")
+
+    for tip in _top_insights(insights_data, "performance_tips"):
+        parts.append(f"- {tip}\n")
+
+    parts.append("\n## 🎮 Game Mechanics Insights\n\n")
+
+    for mechanic in _top_insights(insights_data, "game_mechanics"):
+        parts.append(f"- {mechanic}\n")
+
+    parts.append("\n## ⚠️ Common Issues and Solutions\n\n")
+
+    for issue in _top_insights(insights_data, "common_issues"):
+        parts.append(f"- {issue}\n")
     
-    report += "\n## 📹 Video Summaries\n\n"
+    parts.append("\n## 📹 Video Summaries\n\n")
     
     for video in insights_data:
-        report += f"### {video['title']}\n"
-        report += f"- **Video ID**: {video['video_id']}\n"
-        report += f"- **Transcript Length**: {video['transcript_length']} segments\n"
-        report += f"- **Key Insights**: {len(video['implementation_patterns'])} patterns, "
-        report += f"{len(video['performance_tips'])} tips, {len(video['game_mechanics'])} mechanics\n\n"
+        parts.append(f"### {video['title']}\n")
+        parts.append(f"- **Video ID**: {video['video_id']}\n")
+        parts.append(f"- **Transcript Length**: {video['transcript_length']} segments\n")
+        parts.append(f"- **Key Insights**: {len(video['implementation_patterns'])} patterns, ")
+        parts.append(f"{len(video['performance_tips'])} tips, {len(video['game_mechanics'])} mechanics\n\n")
     
-    report += """
+    parts.append("""
 ## 🔍 Key Takeaways for Our Project
 
 Based on the analysis of these videos, here are the most important insights for our pose detection game:
@@ -204,9 +228,9 @@ Based on the analysis of these videos, here are the most important insights for
 6. Optimize performance and add smoothing
 7. Add multiplayer support if needed
 8. Polish with effects and sound
-"""
-    
-    return report
+""")
+
+    return "".join(parts)
 
 if __name__ == "__main__":
     # Analyze videos
@@ -215,12 +239,13 @@ if __name__ == "__main__":
     # Generate report
     report = generate_markdown_report(insights)
     
-    # Save report
-    with open("/workspaces/pose-detection-game/pose-detection-game/research/videos/transcript-analysis.md", "w") as f:
-        f.write(report)
-    
-    # Save raw data
-    with open("/workspaces/pose-detection-game/pose-detection-game/research/videos/insights-data.json", "w") as f:
-        json.dump(insights, f, indent=2)
+    # Save report - write bytes through a large buffer so the whole file
+    # goes out in a single syscall instead of per-chunk text-mode flushes
+    with open("/workspaces/pose-detection-game/pose-detection-game/research/videos/transcript-analysis.md", "wb", buffering=1024*1024) as f:
+        f.write(report.encode('utf-8'))
+
+    # Save raw data (orjson's C encoder is several times faster than stdlib json)
+    with open("/workspaces/pose-detection-game/pose-detection-game/research/videos/insights-data.json", "wb", buffering=1024*1024) as f:
+        f.write(orjson.dumps(insights, option=orjson.OPT_INDENT_2))
     
     print("\n✅ Analysis complete! Check transcript-analysis.md for the full report.")
\ No newline at end of file